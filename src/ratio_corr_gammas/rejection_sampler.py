@@ -1,6 +1,41 @@
+import math
+
 import numpy as np
 from scipy.optimize import minimize_scalar
-from scipy.stats import uniform
+from scipy.stats import qmc as _qmc
+
+from ratio_corr_gammas.dist import ratio_of_correlated_gammas
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+
+# Upper bound on the number of proposals drawn per block in `RejectionSamplerRCG.rvs`
+_MAX_BATCH_SIZE = 2 ** 20
+
+
+if njit is not None:
+    @njit(nogil=True, fastmath=True, cache=True, inline='always')
+    def _rcg_pdf_scalar(xi, logC, lm, lu, r4lmlu, a_m1, a_p12):
+        """RCG pdf at a single point."""
+        xo = xi * (1 - xi)
+        if xo <= 0:
+            # fastmath assumes finite values, so log(0) must not be taken
+            return 0.
+        s = lm * xi + lu * (1 - xi)
+        D = s * s - r4lmlu * xo
+        # exp/log rather than pow, so that fastmath can vectorize them
+        return s * math.exp(logC + a_m1 * math.log(xo) - a_p12 * math.log(D))
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _rcg_accept_kernel(u1, u2, M, logC, lm, lu, r4lmlu, a_m1, a_p12):
+        """Acceptance mask u2 * M <= pdf(u1), fused into a single (parallel) loop."""
+        out = np.empty(u1.shape[0], dtype=np.bool_)
+        for i in prange(u1.shape[0]):
+            f = _rcg_pdf_scalar(u1[i], logC, lm, lu, r4lmlu, a_m1, a_p12)
+            out[i] = u2[i] * M <= f
+        return out
 
 
 class RejectionSamplerRCG:
@@ -10,7 +45,9 @@ class RejectionSamplerRCG:
     Parameters
     ----------
     dist : rv_continuous
-        An instance of a scipy.stats rv_continuous object representing the RCG distribution.
+        An instance of a scipy.stats rv_continuous object, typically representing the
+        RCG distribution. Other (frozen) distributions on [0, 1] are supported, with
+        slower numerical estimation of `M` and pdf evaluation.
     domain : list, optional
         The domain over which the distribution is defined, default is [0, 1].
 
@@ -29,6 +66,7 @@ class RejectionSamplerRCG:
     def __init__(self, dist, domain=[0, 1]):
         self.dist = dist
         self.domain = domain
+        self._accept = self._make_accept(dist)
         self.M = self._calculate_M()
         self.efficiency = 1 / self.M
 
@@ -44,11 +82,13 @@ class RejectionSamplerRCG:
     def M(self, value):
         self._M = value
 
-    def rvs(self, size, random_state=None):
+    def rvs(self, size, random_state=None, qmc=False):
         """
         Generates random variates using rejection sampling.
-        
-        Note that this does not guarantee `size` samples.
+
+        Proposals are drawn and accepted block-wise until `size` samples are
+        collected. Note that this does not guarantee `size` samples: sampling
+        stops after `10 * size * M` proposals.
 
         Parameters
         ----------
@@ -56,6 +96,11 @@ class RejectionSamplerRCG:
             The number of random variates to generate.
         random_state : int or np.random.Generator, optional
             A seed or random state for reproducible output.
+        qmc : bool, default=False
+            If True, proposals are drawn from a scrambled Sobol sequence instead of
+            pseudo-random uniforms. The accepted samples retain the low-discrepancy
+            structure of the sequence, which lowers the variance of estimates built
+            from them. Note that the samples are then not independent.
 
         Returns
         -------
@@ -70,39 +115,99 @@ class RejectionSamplerRCG:
         urng = np.random.default_rng(random_state)
 
         oversample_scale = 10
-        
+
         # Calculate efficiency-adjusted size
-        size_ = int(size * self.M) * oversample_scale
-        if size_ >= np.finfo(np.float32).max:
+        max_proposals = int(size * self.M) * oversample_scale
+        if max_proposals >= np.finfo(np.float32).max:
             raise ValueError('Size is too large')
 
-        u1 = uniform.rvs(size=size_, random_state=urng)
-        f_u1 = self.dist.pdf(u1)
-        
-        u2 = uniform.rvs(size=size_, random_state=urng)
-        idx = u2 <= f_u1 / self.M
-        
-        v = u1[idx]
-
-        if len(v) < size:
+        batch = min(max(1024, int(size * self.M * 1.5)), _MAX_BATCH_SIZE)
+        if qmc:
+            # Sobol sequences are balanced for powers of 2
+            batch = 1 << (batch - 1).bit_length()
+            engine = _qmc.Sobol(d=2, scramble=True, seed=urng)
+
+        out = np.empty(size)
+        filled = 0
+        n_proposed = 0
+        while filled < size and n_proposed < max_proposals:
+            if qmc:
+                u1, u2 = engine.random(batch).T
+            else:
+                u1 = urng.random(batch)
+                u2 = urng.random(batch)
+            idx = self._accept(u1, u2, self._M)
+
+            acc = u1[idx]
+            k = min(len(acc), size - filled)
+            out[filled:filled + k] = acc[:k]
+            filled += k
+            n_proposed += batch
+
+        if filled < size:
             # TODO: Better handling
             print('Warning: Not enough samples. Consider increasing `size` (and post-sampling) or adjusting the scale parameter `M`.')
-        
-        return v[:size]
+
+        return out[:filled]
 
     def _calculate_M(self):
         """
         Calculate the scale parameter M for the rejection sampler.
-        
-        Uses the Brent method to find a local minimum in the interval 0 < xopt < 1. 
+
+        M is the pdf at its mode 0 < xopt < 1, found analytically for RCG
+        distributions and cached on `dist`, so samplers built for the same RCG
+        distribution compute it only once. For other distributions, the Brent
+        method is used to find a local minimum of -pdf on `domain`.
 
         Returns
         -------
         float
             The calculated scale parameter.
         """
-        res = minimize_scalar(lambda x: -self.dist.pdf(x), bounds=(0, 1), method='bounded')
-        return -res.fun
-    
+        if not isinstance(self.dist, ratio_of_correlated_gammas):
+            res = minimize_scalar(
+                lambda x: -self.dist.pdf(x), bounds=tuple(self.domain), method='bounded'
+            )
+            return float(-res.fun)
+
+        # The RCG mode does not depend on `domain`, so caching on `dist` is safe
+        if not hasattr(self.dist, '_cached_M'):
+            self.dist._cached_M = float(self.dist._pdf(self.dist._mode))
+        return self.dist._cached_M
+
+    @staticmethod
+    def _make_accept(dist):
+        """
+        Build the acceptance test used in the sampling loop.
+
+        Uses the numba kernel for RCG distributions when numba is installed,
+        which evaluates the pdf and the test across all cores without the GIL.
+        Otherwise falls back to `dist._pdf`, bypassing the `pdf` wrapper.
+
+        Returns
+        -------
+        callable
+            Function mapping proposals `u1`, `u2` and the scale `M` to the
+            boolean mask of accepted proposals.
+        """
+        if not isinstance(dist, ratio_of_correlated_gammas):
+            return lambda u1, u2, M: u2 * M <= dist.pdf(u1)
+        if njit is None:
+            return lambda u1, u2, M: u2 * M <= dist._pdf(u1)
+
+        params = (
+            dist._logC, dist.lambda_m, dist.lambda_u,
+            dist._4rlmlu, dist._exp1, dist._exp2,
+        )
+
+        def accept(u1, u2, M):
+            u1 = np.ascontiguousarray(u1, dtype=np.float64)
+            u2 = np.ascontiguousarray(u2, dtype=np.float64)
+            return _rcg_accept_kernel(u1, u2, M, *params)
+
+        # Warm-up to trigger compilation before the first call to `rvs`
+        accept(np.full(1, 0.5), np.full(1, 0.5), 1.)
+        return accept
+
     def __repr__(self):
         return 'RejectionSamplerRCG()'
\ No newline at end of file
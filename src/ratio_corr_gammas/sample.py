@@ -1,6 +1,7 @@
+import numpy as np
 from scipy.stats.sampling import SimpleRatioUniforms, TransformedDensityRejection
 
-from ratio_corr_gammas.dist import ratio_of_correlated_gammas
+from ratio_corr_gammas.dist import _rcg_mixture_rvs, ratio_of_correlated_gammas
 from ratio_corr_gammas.rejection_sampler import RejectionSamplerRCG
 
 
@@ -25,8 +26,9 @@ def simulate_betavals_rcg(size, dist=None, theta=None, alpha=2., rho=0.45, scale
         Scale parameter for the RCG distribution.
     random_state : int or np.random.Generator, optional
         A seed or random state for reproducible output.
-    sampler : {'sru', 'tdr', 'rej'}, optional
-        Type of sampler to use. If None, an appropriate sampler is selected based on `alpha`.
+    sampler : {'direct', 'sru', 'tdr', 'rej'}, optional
+        Type of sampler to use. If None, the beta values are sampled exactly ('direct')
+        from the Poisson-gamma mixture representation of the RCG distribution.
 
     Returns
     -------
@@ -56,15 +58,10 @@ def simulate_betavals_rcg(size, dist=None, theta=None, alpha=2., rho=0.45, scale
     elif not isinstance(dist, ratio_of_correlated_gammas):
         raise TypeError("`dist` must be an instance of `ratio_of_correlated_gammas`")
 
-    if sampler:
-        sampler = samplers[sampler](dist, domain=[0, 1])
+    if sampler is None or sampler == 'direct':
+        sampler = dist
     else:
-        if alpha > 1:
-            sampler = TransformedDensityRejection(dist, domain=[0, 1])
-        else:
-            sampler = RejectionSamplerRCG(dist)
-            if sampler.efficiency < 0.01:
-                sampler = SimpleRatioUniforms(dist, domain=[0, 1])
+        sampler = samplers[sampler](dist, domain=[0, 1])
 
     try:
         samples = sampler.rvs(size=size, random_state=random_state)
@@ -77,4 +74,73 @@ def simulate_betavals_rcg(size, dist=None, theta=None, alpha=2., rho=0.45, scale
     # TODO: Return named tuple with samples and sampler
     # print(sampler)
 
-    return samples
\ No newline at end of file
+    return samples
+
+
+def simulate_betavals_rcg_batch(
+    sizes, thetas, alphas=2., rhos=0.45, scales=1., random_state=None
+):
+    """
+    Simulate DNA methylation beta values for many probes, each with own RCG parameters.
+
+    All probes are sampled exactly in a single vectorized pass, using the Poisson-gamma
+    mixture representation of the RCG distribution (see
+    `ratio_of_correlated_gammas._rvs`).
+
+    Parameters
+    ----------
+    sizes : array_like of int
+        The number of beta values to simulate for each probe.
+    thetas : array_like of float
+        Ratio of expected un-methylated to methylated probe intensity, E_U / E_M, for
+        each probe.
+    alphas : array_like of float, default=2.0
+        Shape parameter of the RCG distribution for each probe.
+    rhos : array_like of float, default=0.45
+        Correlation coefficient between the two gamma random variables for each probe.
+    scales : array_like of float, default=1.0
+        Scale parameter for the RCG distribution for each probe.
+    random_state : int or np.random.Generator, optional
+        A seed or random state for reproducible output.
+
+    Returns
+    -------
+    list of np.ndarray
+        The simulated beta values, one array per probe.
+
+    Raises
+    ------
+    ValueError
+        If the inputs do not broadcast to a 1-D array, any size is not a non-negative
+        integer, any `theta` is not positive, any `alpha` is not greater than 1, or any
+        `rho` is not in [0, 1).
+    """
+    sizes, thetas, alphas, rhos, scales = np.broadcast_arrays(
+        *map(np.atleast_1d, (sizes, thetas, alphas, rhos, scales))
+    )
+    if sizes.ndim != 1:
+        raise ValueError('sizes and parameters must broadcast to a 1-D array of probes')
+    if sizes.size == 0:
+        return []
+    if np.any(sizes < 0) or np.any(sizes != np.floor(sizes)):
+        raise ValueError('sizes must be non-negative integers')
+    sizes = sizes.astype(np.int64)
+
+    if np.any(thetas <= 0):
+        raise ValueError('theta must be positive')
+    if np.any(alphas <= 1):
+        raise ValueError('alpha must be greater than 1')
+    if not np.all((0 <= rhos) & (rhos < 1)):
+        raise ValueError('rho must be in [0, 1)')
+
+    urng = np.random.default_rng(random_state)
+
+    # One entry per sample, probes laid out contiguously
+    lambda_m = np.repeat(scales * np.maximum(thetas, 1.), sizes)
+    lambda_u = np.repeat(scales / np.minimum(thetas, 1.), sizes)
+    alpha = np.repeat(alphas.astype(float), sizes)
+    rho = np.repeat(rhos.astype(float), sizes)
+
+    samples = _rcg_mixture_rvs(alpha, lambda_m, lambda_u, rho, None, urng)
+
+    return np.split(samples, np.cumsum(sizes)[:-1])
@@ -1,9 +1,11 @@
 import numpy as np
 import pytest
-from scipy.stats import kstest
+from scipy.integrate import quad
+from scipy.special import gamma
+from scipy.stats import beta, kstest
 from ratio_corr_gammas.dist import ratio_of_correlated_gammas
 from ratio_corr_gammas.rejection_sampler import RejectionSamplerRCG
-from ratio_corr_gammas.sample import simulate_betavals_rcg
+from ratio_corr_gammas.sample import simulate_betavals_rcg, simulate_betavals_rcg_batch
 
 
 def test_ratio_of_correlated_gammas_creation():
@@ -23,6 +25,112 @@ def test_ratio_of_correlated_gammas_pdf():
     assert isinstance(dist.pdf(x), float)
 
 
+def test_ratio_of_correlated_gammas_pdf_vectorized():
+    """Test that the PDF evaluates elementwise over array inputs."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    x = np.linspace(0, 1, 11)
+    vals = dist.pdf(x)
+    assert vals.shape == x.shape
+    np.testing.assert_allclose(vals, [dist.pdf(xi) for xi in x])
+
+
+@pytest.mark.parametrize('alpha', [90.0, 150.0])
+def test_ratio_of_correlated_gammas_large_alpha(alpha):
+    """Test that large alpha, where gamma(2 * alpha) overflows, gives a finite pdf."""
+    dist = ratio_of_correlated_gammas(alpha, 10.0, 10.0, 0.45)
+    x = np.linspace(0, 1, 101)
+    assert np.all(np.isfinite(dist.pdf(x)))
+    I, _ = quad(dist.pdf, 0, 1, points=[0.5])
+    np.testing.assert_allclose(I, 1, rtol=1e-6)
+
+
+def _rcg_pdf_reference(x, alpha, lambda_m, lambda_u, rho):
+    """Closed-form RCG pdf of Weinhold L, et al. 2016."""
+    s = lambda_m * x + lambda_u * (1 - x)
+    return (
+        gamma(2 * alpha) / gamma(alpha) ** 2
+        * (lambda_m * lambda_u) ** alpha * (1 - rho) ** alpha
+        * (x * (1 - x)) ** (alpha - 1) * s
+        / (s ** 2 - 4 * rho * lambda_m * lambda_u * x * (1 - x)) ** (alpha + 0.5)
+    )
+
+
+@pytest.mark.parametrize(
+    'lambda_m, lambda_u, rho', [(1.0, 0.5, 0.45), (2.0, 7.0, 0.0), (10.0, 1.0, 0.9)]
+)
+def test_ratio_of_correlated_gammas_pdf_kernels(lambda_m, lambda_u, rho):
+    """Test the alpha=2 and general pdf kernels against the closed form."""
+    x = np.linspace(0, 1, 101)
+    ref = _rcg_pdf_reference(x, 2.0, lambda_m, lambda_u, rho)
+    dist = ratio_of_correlated_gammas(2.0, lambda_m, lambda_u, rho)
+    np.testing.assert_allclose(dist._pdf_alpha2(x), ref, rtol=1e-12)
+    np.testing.assert_allclose(dist._pdf_power(x), ref, rtol=1e-12)
+
+    dist = ratio_of_correlated_gammas(3.5, lambda_m, lambda_u, rho)
+    ref = _rcg_pdf_reference(x, 3.5, lambda_m, lambda_u, rho)
+    np.testing.assert_allclose(dist.pdf(x), ref, rtol=1e-12)
+
+
+def test_ratio_of_correlated_gammas_dpdf():
+    """Test the analytic derivative of the PDF against central differences."""
+    dist = ratio_of_correlated_gammas(3.5, 2.0, 0.7, 0.2)
+    x, h = np.linspace(0.05, 0.95, 7), 1e-6
+    fd = (dist.pdf(x + h) - dist.pdf(x - h)) / (2 * h)
+    np.testing.assert_allclose(dist.dpdf(x), fd, rtol=1e-5)
+    assert dist.dpdf(0) == 0
+    assert dist.dpdf(1) == 0
+
+
+def test_ratio_of_correlated_gammas_expect():
+    """Test the Gauss-Legendre expectation against adaptive quadrature."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    np.testing.assert_allclose(dist.expect(), dist.expect(epsabs=1e-12), rtol=1e-8)
+    assert (0, 1, False) in dist._expect_cache
+    np.testing.assert_allclose(
+        dist.expect(lb=np.array(0.2), ub=0.6), dist.expect(lb=0.2, ub=0.6)
+    )
+    np.testing.assert_allclose(
+        dist.expect(lambda x: x ** 2, lb=0.2, ub=0.6, conditional=True),
+        dist.expect(lambda x: x ** 2, lb=0.2, ub=0.6, conditional=True, epsabs=1e-12),
+        rtol=1e-8,
+    )
+
+
+def test_ratio_of_correlated_gammas_expect_scalar_func():
+    """Test that scalar-only functions fall back to adaptive quadrature."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    vals = dist.expect(lambda x: 1. if x > .5 else 0.)
+    ref = dist.expect(lambda x: np.where(x > .5, 1., 0.))
+    np.testing.assert_allclose(vals, ref, rtol=1e-6)
+    np.testing.assert_allclose(dist.expect(lambda x: 1.), 1., rtol=1e-8)
+
+
+@pytest.mark.parametrize(
+    'alpha, theta, rho', [(5.0, 100.0, 0.9), (30.0, 30.0, 0.45), (1.5, 0.02, 0.45)]
+)
+def test_ratio_of_correlated_gammas_expect_peaked(alpha, theta, rho):
+    """Test the expectation of sharply peaked pdfs, unresolved by the fixed rule."""
+    dist = ratio_of_correlated_gammas(alpha, max(theta, 1.), 1. / min(theta, 1.), rho)
+    ref, _ = quad(
+        lambda x: x * dist.pdf(x), 0, 1,
+        points=[dist._mode], epsabs=1e-13, epsrel=1e-12, limit=200,
+    )
+    np.testing.assert_allclose(dist.expect(), ref, rtol=1e-8)
+    np.testing.assert_allclose(dist._expect_cache[(0., 1., False)], ref, rtol=1e-8)
+
+
+def test_ratio_of_correlated_gammas_rvs():
+    """Test exact sampling from the ratio_of_correlated_gammas distribution."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    samples = dist.rvs(size=100_000, random_state=0)
+    assert samples.shape == (100_000,)
+    assert np.all((0 <= samples) & (samples <= 1))
+    np.testing.assert_allclose(samples.mean(), dist.expect(), rtol=1e-2)
+    np.testing.assert_allclose(
+        (samples ** 2).mean(), dist.expect(lambda x: x ** 2), rtol=1e-2
+    )
+
+
 def test_rejection_sampler_rcg():
     """Test initialization and sampling of the RejectionSamplerRCG."""
     dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
@@ -32,6 +140,83 @@ def test_rejection_sampler_rcg():
     assert all(0 <= val <= 1 for val in samples)
 
 
+@pytest.mark.parametrize(
+    'alpha, theta, rho', [(2.0, 2.0, 0.45), (1.5, 0.02, 0.45), (5.0, 100.0, 0.9)]
+)
+def test_rejection_sampler_rcg_M(alpha, theta, rho):
+    """Test that the analytic mode and M match the pdf maximum on a dense grid."""
+    dist = ratio_of_correlated_gammas(alpha, max(theta, 1.), 1. / min(theta, 1.), rho)
+    x = np.linspace(0, 1, 1_000_001)
+    f = dist.pdf(x)
+    assert abs(dist._mode - x[np.argmax(f)]) <= 1e-6
+    M = dist.pdf(dist._mode)
+    assert f.max() <= M <= f.max() * (1 + 1e-6)
+    if M < 100:
+        np.testing.assert_allclose(RejectionSamplerRCG(dist).M, M)
+
+
+def test_rejection_sampler_rcg_cached_M(monkeypatch):
+    """Test that M is computed once per distribution and kept by the setter."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    sampler = RejectionSamplerRCG(dist)
+    M = dist._cached_M
+    assert sampler.M == M
+
+    sampler.M = 1_000
+    assert dist._cached_M == M
+
+    def fail(x):
+        raise AssertionError('M recomputed')
+
+    monkeypatch.setattr(dist, '_pdf', fail)
+    assert RejectionSamplerRCG(dist).M == M
+
+
+@pytest.mark.parametrize('alpha', [2.0, 3.3])
+def test_rejection_sampler_rcg_numba_accept(alpha):
+    """Test the numba acceptance kernel against the NumPy acceptance test."""
+    pytest.importorskip('numba')
+    dist = ratio_of_correlated_gammas(alpha, 1.0, 0.5, 0.45)
+    sampler = RejectionSamplerRCG(dist)
+    urng = np.random.default_rng(0)
+    u1, u2 = urng.random(100_000), urng.random(100_000)
+    u1[:3] = [0., 0.5, 1.]
+
+    f = dist._pdf(u1)
+    mask = sampler._accept(u1, u2, sampler.M)
+    expected = u2 * sampler.M <= f
+    # fastmath may flip comparisons that are tied up to rounding
+    tied = np.isclose(u2 * sampler.M, f, rtol=1e-12, atol=0)
+    assert np.array_equal(mask[~tied], expected[~tied])
+
+
+def test_rejection_sampler_generic_dist_domain():
+    """Test that M for non-RCG distributions follows `domain` and is not cached."""
+    dist = beta(2, 3)
+    assert RejectionSamplerRCG(dist, domain=[0.6, 1]).M < dist.pdf(1 / 3)
+    np.testing.assert_allclose(RejectionSamplerRCG(dist).M, dist.pdf(1 / 3), rtol=1e-6)
+    assert not hasattr(dist, '_cached_M')
+
+
+def test_rejection_sampler_generic_dist():
+    """Test rejection sampling from a non-RCG distribution on [0, 1]."""
+    dist = beta(2, 3)
+    sampler = RejectionSamplerRCG(dist)
+    np.testing.assert_allclose(sampler.M, dist.pdf(1 / 3), rtol=1e-6)
+    samples = sampler.rvs(size=10_000, random_state=0)
+    assert len(samples) == 10_000
+    np.testing.assert_allclose(samples.mean(), dist.mean(), rtol=2e-2)
+
+
+def test_rejection_sampler_rcg_qmc():
+    """Test rejection sampling with scrambled Sobol proposals."""
+    dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
+    sampler = RejectionSamplerRCG(dist)
+    samples = sampler.rvs(size=10_000, random_state=0, qmc=True)
+    assert len(samples) == 10_000
+    np.testing.assert_allclose(samples.mean(), dist.expect(), rtol=1e-2)
+
+
 def test_simulate_betavals_rcg():
     """Test the simulate_betavals_rcg function."""
     size = 100
@@ -40,4 +225,50 @@ def test_simulate_betavals_rcg():
     # GoF test (e.g., Kolmogorov-Smirnov) to check if samples follow the expected distribution
     dist = ratio_of_correlated_gammas(2.0, 1.0, 0.5, 0.45)
     stat, p_value = kstest(samples, dist.cdf)
-    assert p_value > 0.05
\ No newline at end of file
+    assert p_value > 0.05
+
+
+@pytest.mark.parametrize('sampler', ['direct', 'tdr', 'rej'])
+def test_simulate_betavals_rcg_sampler(sampler):
+    """Test simulate_betavals_rcg with each sampler against the expected beta value."""
+    samples = simulate_betavals_rcg(
+        20_000, theta=2.0, alpha=2.0, rho=0.45, random_state=0, sampler=sampler
+    )
+    assert len(samples) == 20_000
+    assert np.all((0 <= samples) & (samples <= 1))
+    dist = ratio_of_correlated_gammas(2.0, 2.0, 1.0, 0.45)
+    np.testing.assert_allclose(samples.mean(), dist.expect(), rtol=2e-2)
+
+
+def test_simulate_betavals_rcg_batch():
+    """Test batched simulation over per-probe RCG parameters."""
+    sizes, thetas, alphas = [50_000, 10, 50_000], [0.5, 1.0, 3.0], [2.0, 2.5, 3.0]
+    samples = simulate_betavals_rcg_batch(
+        sizes, thetas, alphas, rhos=0.45, random_state=0
+    )
+    assert [len(s) for s in samples] == sizes
+    for s, theta, alpha in zip(samples, thetas, alphas):
+        assert np.all((0 <= s) & (s <= 1))
+        if len(s) > 1_000:
+            dist = ratio_of_correlated_gammas(
+                alpha, max(theta, 1.), 1. / min(theta, 1.), 0.45
+            )
+            np.testing.assert_allclose(s.mean(), dist.expect(), rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        simulate_betavals_rcg_batch([10], [-1.0])
+
+
+def test_simulate_betavals_rcg_batch_inputs():
+    """Test input validation and edge cases of batched simulation."""
+    assert simulate_betavals_rcg_batch([], []) == []
+    assert [len(s) for s in simulate_betavals_rcg_batch(5, 2.0, random_state=0)] == [5]
+    samples = simulate_betavals_rcg_batch([3, 0], 2.0, random_state=0)
+    assert [len(s) for s in samples] == [3, 0]
+
+    with pytest.raises(ValueError, match='1-D'):
+        simulate_betavals_rcg_batch([[10, 20]], [[1.0, 2.0]])
+    with pytest.raises(ValueError, match='integers'):
+        simulate_betavals_rcg_batch([10.5], [1.0])
+    with pytest.raises(ValueError, match='integers'):
+        simulate_betavals_rcg_batch([-1], [1.0])